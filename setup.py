@@ -12,6 +12,12 @@ setup(
         "websockets>=11.0.0",
         "rich>=13.0.0",
     ],
+    extras_require={
+        "speedups": [
+            "orjson>=3.0.0",
+            "uvloop>=0.14.0; sys_platform != 'win32'",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "takershield=takershield.observer:main",
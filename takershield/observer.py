@@ -16,11 +16,18 @@ Features:
 
 import argparse
 import asyncio
+import contextlib
+import functools
+import inspect
 import json
+import os
+import random
 import sys
+import threading
 import time
-import select
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import Optional, Dict, Any
 
 from . import __version__
@@ -31,7 +38,7 @@ try:
     from rich.console import Console, Group
     from rich.live import Live
     from rich.rule import Rule
-    from rich.table import Table
+    from rich.table import Column, Table
     from rich.panel import Panel
     from rich.layout import Layout
     from rich.text import Text
@@ -41,6 +48,27 @@ except ImportError:
     print("Install dependencies: pip install websockets rich")
     sys.exit(1)
 
+# Optional fast JSON codec (pip install orjson or msgspec); falls back to stdlib json
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        # Decode so commands still go out as text frames
+        return orjson.dumps(obj).decode()
+except ImportError:
+    try:
+        import msgspec
+
+        _loads = msgspec.json.decode
+
+        def _dumps(obj) -> str:
+            return msgspec.json.encode(obj).decode()
+    except ImportError:
+        _loads = json.loads
+        _dumps = json.dumps
+
 # SSL context for connecting
 SSL_CONTEXT = ssl.create_default_context()
 SSL_CONTEXT.check_hostname = False
@@ -49,28 +77,118 @@ SSL_CONTEXT.verify_mode = ssl.CERT_NONE
 # Display limits
 MAX_EVENTS = 20  # Maximum risk events shown in table
 
+# Search results are reused for this long (seconds) - events can gain contracts later
+SEARCH_CACHE_TTL = 60
+
+# Command keys (raw stdin bytes)
+KEY_QUIT = ord("q")
+KEY_HELP = ord("h")
+KEY_DEMO = ord("d")
+KEY_CLEAR = ord("c")
+KEY_ADD = ord("a")
+KEY_REMOVE = ord("r")
+
+# Rendering - frames are drawn on state changes, coalesced and with a periodic floor
+RENDER_MIN_INTERVAL = 0.25  # At most 4 frames/s under bursts of updates
+RENDER_IDLE_TIMEOUT = 1.0  # Redraw at least this often (clocks, stale-data warning)
+
+# Reconnect backoff (seconds) - doubles per failed attempt, jittered
+RECONNECT_DELAY_MIN = 0.5
+RECONNECT_DELAY_MAX = 30
+
+# Table column schemas - copied (without cells) into each freshly built table
+MARKET_COLUMNS = (
+    Column("Ticker", style="dim", width=28),
+    Column("Bid", justify="right", width=6),
+    Column("Ask", justify="right", width=6),
+    Column("Mid", justify="right", width=7),
+    Column("Spread", justify="right", width=6),
+    Column("Depth", justify="right", width=8),
+    Column("Signal", justify="center", width=24),
+    Column("Closes", justify="right", width=10),
+    Column("p99", justify="right", width=5),
+)
+EVENTS_COLUMNS = (
+    Column("Ticker", width=26),
+    Column("Trigger", width=14),
+    Column("Action", justify="center", width=12),
+    Column("Age", justify="right", width=6),
+    Column("Shielded", justify="right", width=8),
+    Column("Move (30s/2m/5m)", justify="right", width=30),
+)
+
+# Short labels for the first trigger/caution reason in the Signal column
+NO_QUOTE_LABELS = {
+    "time_to_event": "ttc ▼",
+    "spread_blowout": "sprd ▲",
+    "high_volatility": "p99 ▲",
+    "ttc_spread": "ttc+sprd",
+    "vol_spread": "p99+sprd",
+    "no_book": "no book",
+    "one_sided": "1-side",
+    "market_closed": "closed",
+    "ml_risk": "ml",
+}
+CAUTION_LABELS = {
+    "spread_elevated": "sprd ▲",
+    "spread_widening": "sprd ▲",
+    "volatility_rising": "vol ▲",
+    "depth_dropping": "depth ▼",
+    "time_liquidity": "late+liq",
+    "time_approaching": "ttc ▼",  # legacy
+}
+
+# Short display names for trigger reasons in the Risk Events table
+TRIGGER_LABELS = {
+    "spread_blowout": "sprd ▲",
+    "time_to_event": "ttc ▼",
+    "ttc_spread": "ttc+sprd",
+    "vol_spread": "vol+sprd",
+    "high_volatility": "vol ▲",
+    "time_liquidity": "late+liq",
+    "no_book": "no book",
+    "one_sided": "1-side",
+    "market_closed": "closed",
+}
+
+# Pre-formatted Signal cells keyed by (regime, reason)
+SIGNAL_STRS = {
+    **{("NO_QUOTE", reason): f"[red]🛑 NO_QUOTE[/red] [dim]( {label} )[/dim]"
+       for reason, label in NO_QUOTE_LABELS.items()},
+    **{("CAUTION", reason): f"[yellow]⚠️ CAUTION[/yellow] [dim]( {label} )[/dim]"
+       for reason, label in CAUTION_LABELS.items()},
+    ("SAFE", None): "[bold green]✅ SAFE[/bold green]",
+    ("SAFE", "cleared"): "[bold green]✅ SAFE[/bold green] [cyan](cleared)[/cyan]",
+}
+
 
 console = Console()
 
 
+def _intern(value):
+    """sys.intern payload strings; anything else (int ids, null tickers) is passed through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class ObserverState:
     """Track observer state."""
     
     def __init__(self):
         self.connected = False
         self.server_url = ""
-        self.last_heartbeat: Optional[float] = None
+        self.last_heartbeat: Optional[float] = None  # time.monotonic()
+        self.reconnect_delay: float = RECONNECT_DELAY_MIN
         
         # Market data
         self.markets: Dict[str, dict] = {}
         
         # Events
-        self.would_cancel_events: list[dict] = []
         self.max_events = 20  # Keep last N events
+        self.would_cancel_events: deque = deque(maxlen=self.max_events)
         
         # Stats
         self.updates_received = 0
-        self.connect_time: Optional[float] = None
+        self.connect_time: Optional[float] = None  # time.monotonic()
         
         # Latency tracking
         self.last_poll_latency = 0.0
@@ -94,14 +212,23 @@ class ObserverState:
         self.available_markets_info: Optional[list] = None
         
         # Search results
-        self.search_results: list = []
+        self.search_results: list = []  # Tickers
+        self.keys: Optional[asyncio.Queue] = None  # Raw keystroke bytes (created on the loop)
+        self.search_ready: Optional[asyncio.Event] = None  # Set when results arrive (created on the loop)
+        self.search_query = ""  # Query of the pending search_ticker request ("" = none pending)
+        self.search_menu: Optional[Text] = None  # Pre-rendered contract menu for search_results
+        self.search_cache: Dict[str, tuple] = {}  # query -> (time, results, menu), reused without a round-trip
         
         # Config (set from CLI args)
         self.position_size = 100  # Contracts per trade (default)
         self.quote_side = "unknown"  # yes, no, both, unknown
+        self.auto_both = False  # Add both sides of a 2-contract event without the menu
         
         # Event tracking (from server)
         self.active_events: Dict[str, dict] = {}  # event_id -> EventRecord
+        # event_ids of all active_events, newest t0_ts first (not capped at MAX_EVENTS:
+        # completed events are only skipped at render time, so older ongoing ones must stay)
+        self.visible_event_order: deque = deque()
         self.cleared_events_ts: float = 0  # Events before this timestamp are hidden
         
         # Regime transition tracking
@@ -110,50 +237,132 @@ class ObserverState:
         
         # Help screen mode
         self.help_mode = False
+        
+        # Render cache - sections are rebuilt only when their data changes
+        self.dirty_markets = True
+        self.dirty_events = True
+        self.markets_refresh_until: float = 0  # Keep rebuilding while a "(cleared)" label is shown
+        self._layout: Optional[Layout] = None
+        self._market_table: Optional[Table] = None
+        self._events_table: Optional[Table] = None
+        self._events_second = 0  # Wall-clock second the events table was built (Age column)
+        self.render_event: Optional[asyncio.Event] = None  # Wakes run_display (created on its loop)
+    
+    def mark_dirty(self, markets: bool = False, events: bool = False):
+        """Flag display sections for rebuild and wake the renderer."""
+        if markets:
+            self.dirty_markets = True
+        if events:
+            self.dirty_events = True
+        if self.render_event is not None:
+            self.render_event.set()
     
     def set_status(self, msg: str, duration: float = 5):
         self.status_msg = msg
-        self.status_time = time.time()
+        self.status_time = time.monotonic()
         self.status_duration = duration
+        self.mark_dirty()
     
     def get_status(self) -> str:
-        if self.status_time and time.time() - self.status_time < self.status_duration:
+        if self.status_time and time.monotonic() - self.status_time < self.status_duration:
             return self.status_msg
         return ""
     
+    def next_reconnect_delay(self) -> float:
+        """Get jittered exponential backoff delay for the next reconnect."""
+        delay = min(RECONNECT_DELAY_MAX, self.reconnect_delay * (0.5 + random.random()))
+        self.reconnect_delay = min(RECONNECT_DELAY_MAX, self.reconnect_delay * 2)
+        return delay
+    
     def update_market(self, data: dict):
         ticker = data.get("ticker")
         if ticker:
+            # Intern so the per-ticker dict lookups below (and in rendering) hit by identity
+            ticker = data["ticker"] = _intern(ticker)
+            
             # Track regime transitions
+            last_regime = self.last_regime
             new_regime = data.get("regime", "")
-            old_regime = self.last_regime.get(ticker, "")
+            old_regime = last_regime.get(ticker, "")
             
-            # Detect NO_QUOTE → SAFE transition (cleared)
-            if old_regime == "NO_QUOTE" and new_regime in ("SAFE", "CAUTION"):
-                self.cleared_at[ticker] = time.time()
+            if new_regime != old_regime:
+                # Detect NO_QUOTE → SAFE transition (cleared)
+                if old_regime == "NO_QUOTE" and new_regime in ("SAFE", "CAUTION"):
+                    cleared_time = time.time()
+                    self.cleared_at[ticker] = cleared_time
+                    self.markets_refresh_until = cleared_time + 5
+                
+                # Shielded column in the events table depends on regime transitions
+                self.mark_dirty(events=True)
             
-            self.last_regime[ticker] = new_regime
+            last_regime[ticker] = new_regime
             self.markets[ticker] = data
             self.updates_received += 1
             self.last_poll_latency = data.get("poll_latency_ms", 0)
             self.last_compute_latency = data.get("compute_latency_ms", 0)
+            self.mark_dirty(markets=True)
     
     def add_would_cancel(self, data: dict):
         # Only add events after cleared timestamp
         # WouldCancelEvent uses timestamp_ms, EventRecord uses t0_ts
         ts = data.get("t0_ts") or data.get("timestamp_ms", 0)
         if ts > self.cleared_events_ts:
-            self.would_cancel_events.append(data)
-            if len(self.would_cancel_events) > self.max_events:
-                self.would_cancel_events.pop(0)
+            if data.get("ticker"):
+                data["ticker"] = _intern(data["ticker"])
+            self.would_cancel_events.append(data)  # Bounded deque drops the oldest
+            self.mark_dirty(events=True)
+    
+    def update_event(self, data: dict):
+        event_id = data.get("event_id")
+        ts = data.get("t0_ts") or data.get("timestamp_ms", 0)
+        # Only show events after cleared timestamp
+        if not event_id or ts <= self.cleared_events_ts:
+            return
+        
+        # Intern dict keys - ticker is looked up in cleared_at/last_regime when rendering
+        event_id = _intern(event_id)
+        if data.get("ticker"):
+            data["ticker"] = _intern(data["ticker"])
+        
+        is_new = event_id not in self.active_events
+        self.active_events[event_id] = data
+        self.mark_dirty(events=True)
+        
+        # Keep display order incrementally instead of sorting every frame
+        if is_new:
+            order = self.visible_event_order
+            t0_ts = data.get("t0_ts", 0)
+            if not order or t0_ts >= self.active_events[order[0]].get("t0_ts", 0):
+                order.appendleft(event_id)
+            else:
+                # Out-of-order arrival (rare) - insert in place, late events land near the front
+                active_events = self.active_events
+                for pos, other in enumerate(order):
+                    if t0_ts >= active_events[other].get("t0_ts", 0):
+                        break
+                else:
+                    pos = len(order)
+                order.insert(pos, event_id)
     
     def update_heartbeat(self, data: dict):
-        self.last_heartbeat = time.time()
+        self.last_heartbeat = time.monotonic()
+        self.mark_dirty()
 
 
 state = ObserverState()
 
 
+@functools.lru_cache(maxsize=256)
+def normalize_ticker(text: str) -> str:
+    """Normalize user-entered ticker text (cached, interned - repeats return the same string)."""
+    return sys.intern(text.upper())
+
+
+def _now_ms() -> int:
+    """Wall-clock time in integer milliseconds (matches server timestamps)."""
+    return time.time_ns() // 1_000_000
+
+
 def get_regime_style(regime: str) -> str:
     """Get color style for regime."""
     if regime == "SAFE":
@@ -164,6 +373,16 @@ def get_regime_style(regime: str) -> str:
         return "bold red"
 
 
+def get_depth_style(depth: int) -> str:
+    """Get color style for top-of-book depth."""
+    if depth >= 1000:
+        return "green"
+    elif depth >= 300:
+        return "yellow"
+    else:
+        return "red"
+
+
 def get_risk_style(score: float) -> str:
     """Get color style for risk score."""
     if score < 0.35:
@@ -174,23 +393,23 @@ def get_risk_style(score: float) -> str:
         return "red"
 
 
+OVERTIME_STR = "[yellow]OT[/yellow]"  # Overtime - past expected but still active
+CLOSED_STR = "[red]CLOSED[/red]"
+
+
 def format_time(seconds: float) -> str:
     """Format seconds as time string."""
     if seconds < 0:
-        return "[yellow]OT[/yellow]"  # Overtime - past expected but still active
-    if seconds > 86400 * 7:  # > 1 week
-        days = int(seconds // 86400)
+        return OVERTIME_STR
+    days, rem = divmod(int(seconds), 86400)
+    hours, rem = divmod(rem, 3600)
+    mins, secs = divmod(rem, 60)
+    if days >= 7:  # >= 1 week
         return f"[dim]{days}d[/dim]"
-    if seconds > 86400:  # > 1 day
-        days = int(seconds // 86400)
-        hours = int((seconds % 86400) // 3600)
+    if days:
         return f"{days}d {hours}h"
-    if seconds > 3600:  # > 1 hour
-        hours = int(seconds // 3600)
-        mins = int((seconds % 3600) // 60)
+    if hours:
         return f"{hours}h {mins}m"
-    mins = int(seconds // 60)
-    secs = int(seconds % 60)
     return f"{mins}:{secs:02d}"
 
 
@@ -198,15 +417,54 @@ def format_time_with_type(seconds: float, time_type: str) -> str:
     """Format time with indicator for type (ends vs closes)."""
     # Handle closed/settled markets
     if time_type == "closed":
-        return "[red]CLOSED[/red]"
+        return CLOSED_STR
     # Now that we pick the earlier of close_time and expected_expiration_time,
     # we're always showing the most useful time. No need for ~ prefix.
     return format_time(seconds)
 
 
-def build_market_table() -> Table:
-    """Build market status table."""
+# Move window markup (open, close) indexed by [severity][direction]
+MOVE_SEVERITY_STYLES = ("green", "yellow", "red")  # < 5¢, < 10¢, >= 10¢
+MOVE_ARROWS = ("▼", "▲", "◆")  # down wins, up wins, tie
+MOVE_MARKUP = tuple(
+    tuple((f"[{style}]{arrow}", f"[/{style}]") for arrow in MOVE_ARROWS)
+    for style in MOVE_SEVERITY_STYLES
+)
+MOVE_NONE_STR = "[dim]—[/dim]"
+
+
+def format_move_window(down: float, up: float) -> str:
+    """Format a single window's move with direction indicator.
+    
+    Format: {arrow}{headline}({down}/{up})
+    - down = adverse to YES quoter (price dropped)
+    - up = adverse to NO quoter (price rose)
+    - headline = max(down, up)
+    - arrow: ▼ if down wins, ▲ if up wins, ◆ if tie
+    """
+    headline = max(down, up)
+    if headline == 0:
+        return MOVE_NONE_STR
+    
+    direction = 0 if down > up else 1 if up > down else 2
+    # Color code by severity
+    severity = 2 if headline >= 10 else 1 if headline >= 5 else 0
+    
+    open_tag, close_tag = MOVE_MARKUP[severity][direction]
+    return f"{open_tag}{headline:.0f}{close_tag}({down:.0f}/{up:.0f})"
+
+
+@functools.lru_cache(maxsize=128)
+def format_triggers(trigger_reasons: tuple) -> str:
+    """Format trigger reasons as a Trigger cell (cached - combinations recur)."""
+    triggers = ", ".join(TRIGGER_LABELS.get(t, t[:6]) for t in trigger_reasons)
+    return f"[bold red]{triggers}[/bold red]"
+
+
+def build_market_table(now: float) -> Table:
+    """Build market status table (now = frame timestamp, seconds)."""
     table = Table(
+        *(column.copy() for column in MARKET_COLUMNS),
         title="📊 Market Status",
         box=box.SIMPLE,
         show_header=True,
@@ -215,79 +473,38 @@ def build_market_table() -> Table:
         padding=(0, 1)
     )
     
-    table.add_column("Ticker", style="dim", width=28)
-    table.add_column("Bid", justify="right", width=6)
-    table.add_column("Ask", justify="right", width=6)
-    table.add_column("Mid", justify="right", width=7)
-    table.add_column("Spread", justify="right", width=6)
-    table.add_column("Depth", justify="right", width=8)
-    table.add_column("Signal", justify="center", width=24)
-    table.add_column("Closes", justify="right", width=10)
-    table.add_column("p99", justify="right", width=5)
-    
     for ticker, data in state.markets.items():
         regime = data.get("regime", "?")
         trigger_reasons = data.get("trigger_reasons", [])
         depth = data.get("depth", 0)
         
         # Format depth with color based on level
-        if depth and depth >= 1000:
-            depth_str = f"[green]{depth:,}[/green]"
-        elif depth and depth >= 300:
-            depth_str = f"[yellow]{depth:,}[/yellow]"
-        elif depth:
-            depth_str = f"[red]{depth:,}[/red]"
+        if depth:
+            depth_style = get_depth_style(depth)
+            depth_str = f"[{depth_style}]{depth:,}[/{depth_style}]"
         else:
             depth_str = "[dim]-[/dim]"
         
-        # Signal with trigger reason for NO_QUOTE or CAUTION
+        # Signal with first trigger reason for NO_QUOTE or CAUTION
         caution_reasons = data.get("caution_reasons", [])
         
         if regime == "NO_QUOTE" and trigger_reasons:
-            # Show first trigger reason with emoji
             reason = trigger_reasons[0]
-            if reason == "time_to_event":
-                signal_str = "[red]🛑 NO_QUOTE[/red] [dim]( ttc ▼ )[/dim]"
-            elif reason == "spread_blowout":
-                signal_str = "[red]🛑 NO_QUOTE[/red] [dim]( sprd ▲ )[/dim]"
-            elif reason == "high_volatility":
-                signal_str = "[red]🛑 NO_QUOTE[/red] [dim]( p99 ▲ )[/dim]"
-            elif reason == "ttc_spread":
-                signal_str = "[red]🛑 NO_QUOTE[/red] [dim]( ttc+sprd )[/dim]"
-            elif reason == "vol_spread":
-                signal_str = "[red]🛑 NO_QUOTE[/red] [dim]( p99+sprd )[/dim]"
-            elif reason == "no_book":
-                signal_str = "[red]🛑 NO_QUOTE[/red] [dim]( no book )[/dim]"
-            elif reason == "one_sided":
-                signal_str = "[red]🛑 NO_QUOTE[/red] [dim]( 1-side )[/dim]"
-            elif reason == "market_closed":
-                signal_str = "[red]🛑 NO_QUOTE[/red] [dim]( closed )[/dim]"
-            elif reason == "ml_risk":
-                signal_str = "[red]🛑 NO_QUOTE[/red] [dim]( ml )[/dim]"
-            else:
-                signal_str = Text(regime, style=get_regime_style(regime))
         elif regime == "CAUTION" and caution_reasons:
-            # Show first caution reason with direction emoji
             reason = caution_reasons[0]
-            reason_labels = {
-                "spread_elevated": "sprd ▲",
-                "spread_widening": "sprd ▲",
-                "volatility_rising": "vol ▲",
-                "depth_dropping": "depth ▼",
-                "time_liquidity": "late+liq",
-                "time_approaching": "ttc ▼",  # legacy
-            }
-            label = reason_labels.get(reason, reason[:6])
-            signal_str = f"[yellow]⚠️ CAUTION[/yellow] [dim]( {label} )[/dim]"
         elif regime == "SAFE":
             # Check if recently cleared from NO_QUOTE
             cleared_time = state.cleared_at.get(ticker, 0)
-            if time.time() - cleared_time < 5:
-                signal_str = "[bold green]✅ SAFE[/bold green] [cyan](cleared)[/cyan]"
-            else:
-                signal_str = "[bold green]✅ SAFE[/bold green]"
+            reason = "cleared" if now - cleared_time < 5 else None
         else:
-            signal_str = Text(regime, style=get_regime_style(regime))
+            reason = None
+        
+        signal_str = SIGNAL_STRS.get((regime, reason))
+        if signal_str is None:
+            if regime == "CAUTION" and reason:
+                signal_str = f"[yellow]⚠️ CAUTION[/yellow] [dim]( {reason[:6]} )[/dim]"
+            else:
+                signal_str = Text(regime, style=get_regime_style(regime))
         
         table.add_row(
             ticker[-28:],  # Truncate ticker
@@ -307,9 +524,10 @@ def build_market_table() -> Table:
     return table
 
 
-def build_events_table() -> Table:
-    """Build would-cancel events table with savings tracking."""
+def build_events_table(now: float) -> Table:
+    """Build would-cancel events table with savings tracking (now = frame timestamp, seconds)."""
     table = Table(
+        *(column.copy() for column in EVENTS_COLUMNS),
         title="🚨 Risk Events",
         box=box.SIMPLE,
         show_header=True,
@@ -318,62 +536,12 @@ def build_events_table() -> Table:
         padding=(0, 1)
     )
     
-    table.add_column("Ticker", width=26)
-    table.add_column("Trigger", width=14)
-    table.add_column("Action", justify="center", width=12)
-    table.add_column("Age", justify="right", width=6)
-    table.add_column("Shielded", justify="right", width=8)
-    table.add_column("Move (30s/2m/5m)", justify="right", width=30)
-    
-    now_ms = int(time.time() * 1000)
-    now_sec = time.time()
-    
-    # Map trigger reasons to short display names with emoji
-    trigger_labels = {
-        "spread_blowout": "sprd ▲",
-        "time_to_event": "ttc ▼",
-        "ttc_spread": "ttc+sprd",
-        "vol_spread": "vol+sprd",
-        "high_volatility": "vol ▲",
-        "time_liquidity": "late+liq",
-        "no_book": "no book",
-        "one_sided": "1-side",
-        "market_closed": "closed",
-    }
-    
-    def format_move_window(down: float, up: float) -> str:
-        """Format a single window's move with direction indicator.
-        
-        Format: {arrow}{headline}({down}/{up})
-        - down = adverse to YES quoter (price dropped)
-        - up = adverse to NO quoter (price rose)
-        - headline = max(down, up)
-        - arrow: ▼ if down wins, ▲ if up wins, ◆ if tie
-        """
-        headline = max(down, up)
-        if headline == 0:
-            return "[dim]—[/dim]"
-        
-        if down > up:
-            arrow = "▼"
-        elif up > down:
-            arrow = "▲"
-        else:
-            arrow = "◆"
-        
-        # Color code by severity
-        if headline >= 10:
-            style = "red"
-        elif headline >= 5:
-            style = "yellow"
-        else:
-            style = "green"
-        
-        return f"[{style}]{arrow}{headline:.0f}[/{style}]({down:.0f}/{up:.0f})"
+    now_ms = int(now * 1000)
     
-    # Show active events from server (filter out old completed events)
+    # Show active events from server, newest first (filter out old completed events)
     visible_events = []
-    for event_id, event in list(state.active_events.items()):
+    for event_id in state.visible_event_order:
+        event = state.active_events[event_id]
         tracking_complete = event.get("tracking_complete", False)
         t0_ts = event.get("t0_ts", now_ms)
         elapsed_sec = (now_ms - t0_ts) / 1000
@@ -382,16 +550,13 @@ def build_events_table() -> Table:
         if tracking_complete and elapsed_sec > 60:
             continue
         visible_events.append((event_id, event))
+        if len(visible_events) == MAX_EVENTS:
+            break
     
-    # Sort by t0_ts descending (newest first), take last 10
-    visible_events.sort(key=lambda x: x[1].get("t0_ts", 0), reverse=True)
-    
-    for event_id, event in visible_events[:MAX_EVENTS]:
+    for event_id, event in visible_events:
         full_ticker = event.get("ticker", "?")
         ticker = full_ticker[-26:]
-        raw_triggers = event.get("trigger_reasons", [])
-        triggers = ", ".join(trigger_labels.get(t, t[:6]) for t in raw_triggers)
-        trigger_str = f"[bold red]{triggers}[/bold red]"
+        trigger_str = format_triggers(tuple(event.get("trigger_reasons", [])))
         
         # Get adverse moves per direction
         # down = adverse_yes = price dropped (YES quoter loses)
@@ -449,10 +614,8 @@ def build_events_table() -> Table:
     
     if not visible_events:
         # Fall back to legacy events
-        for event in reversed(state.would_cancel_events[-5:]):
-            raw_triggers = event.get("trigger_reasons", [])
-            triggers = ", ".join(trigger_labels.get(t, t[:6]) for t in raw_triggers)
-            trigger_str = f"[bold red]{triggers}[/bold red]"
+        for event in islice(reversed(state.would_cancel_events), 5):
+            trigger_str = format_triggers(tuple(event.get("trigger_reasons", [])))
             table.add_row(
                 event.get("ticker", "?")[-26:],
                 trigger_str,
@@ -467,14 +630,14 @@ def build_events_table() -> Table:
     return table
 
 
-def build_stats_panel() -> Panel:
-    """Build stats panel."""
-    uptime = time.time() - state.connect_time if state.connect_time else 0
+def build_stats_panel(mono_now: float) -> Panel:
+    """Build stats panel (mono_now = frame time.monotonic())."""
+    uptime = mono_now - state.connect_time if state.connect_time else 0
     
     heartbeat_ago = ""
     data_stale = False
     if state.last_heartbeat:
-        ago = time.time() - state.last_heartbeat
+        ago = mono_now - state.last_heartbeat
         heartbeat_ago = f"{ago:.1f}s ago"
         if ago > 15:
             data_stale = True
@@ -486,50 +649,46 @@ def build_stats_panel() -> Panel:
         adv_5m = max(event.get("adverse_yes_5m", 0), event.get("adverse_no_5m", 0))
         total_adverse_cents += adv_5m
     
-    content = Text()
-    
     # Shadow mode label
-    content.append("🔒 READ-ONLY (no keys)\n", style="cyan bold")
+    markup = "[cyan bold]🔒 READ-ONLY (no keys)[/cyan bold]\n"
     
     # Data stale warning
     if data_stale:
-        content.append("⚠️  DATA STALE\n", style="red bold")
+        markup += "[red bold]⚠️  DATA STALE[/red bold]\n"
     
-    content.append("🔗 ", style="bold")
-    content.append("Connected" if state.connected else "Disconnected", 
-                   style="green" if state.connected else "red")
-    content.append(f"\n⏱️  Uptime: {format_time(uptime)}")
-    content.append(f"\n📨 Updates: {state.updates_received}")
-    content.append(f"\n💓 Heartbeat: {heartbeat_ago}")
+    conn_str = "[green]Connected[/green]" if state.connected else "[red]Disconnected[/red]"
+    markup += (
+        f"[bold]🔗 [/bold]{conn_str}"
+        f"\n⏱️  Uptime: {format_time(uptime)}"
+        f"\n📨 Updates: {state.updates_received}"
+        f"\n💓 Heartbeat: {heartbeat_ago}"
+    )
     
     # Show cancel stats
     if cancel_count > 0:
-        content.append(f"\n\n🚨 Cancels: ")
-        content.append(f"{cancel_count}", style="red bold")
-        content.append(f"\n💰 Avoided: ")
-        content.append(f"{total_adverse_cents:.0f}¢", style="green bold")
+        markup += (
+            f"\n\n🚨 Cancels: [red bold]{cancel_count}[/red bold]"
+            f"\n💰 Avoided: [green bold]{total_adverse_cents:.0f}¢[/green bold]"
+        )
     
-    return Panel(content, title="Status", border_style="blue")
+    return Panel(Text.from_markup(markup), title="Status", border_style="blue")
 
 
 def build_latency_panel() -> Panel:
     """Build latency panel."""
-    content = Text()
-    
     # Color code latencies
     poll_style = "green" if state.last_poll_latency < 100 else "yellow" if state.last_poll_latency < 200 else "red"
     compute_style = "green" if state.last_compute_latency < 10 else "yellow" if state.last_compute_latency < 50 else "red"
     ws_latency = abs(state.last_ws_latency)  # Absolute value due to clock skew
     ws_style = "green" if ws_latency < 50 else "yellow" if ws_latency < 100 else "red"
     
-    content.append("📡 Poll: ", style="dim")
-    content.append(f"{state.last_poll_latency:.0f}ms\n", style=poll_style)
-    content.append("🧠 Compute: ", style="dim")
-    content.append(f"{state.last_compute_latency:.1f}ms\n", style=compute_style)
-    content.append("🌐 WS: ", style="dim")
-    content.append(f"{ws_latency:.0f}ms", style=ws_style)
+    markup = (
+        f"[dim]📡 Poll: [/dim][{poll_style}]{state.last_poll_latency:.0f}ms[/{poll_style}]\n"
+        f"[dim]🧠 Compute: [/dim][{compute_style}]{state.last_compute_latency:.1f}ms[/{compute_style}]\n"
+        f"[dim]🌐 WS: [/dim][{ws_style}]{ws_latency:.0f}ms[/{ws_style}]"
+    )
     
-    return Panel(content, title="Latency", border_style="magenta")
+    return Panel(Text.from_markup(markup), title="Latency", border_style="magenta")
 
 
 def build_help_screen() -> Panel:
@@ -590,7 +749,56 @@ def build_layout() -> Layout:
         
         return layout
     
-    # Normal layout
+    # Normal layout - skeleton is built once, sections are updated in place
+    layout = state._layout
+    if layout is None:
+        layout = state._layout = build_main_layout()
+    
+    # Read the clocks once per frame and share them across sections
+    # Wall-clock for server timestamps, monotonic for local durations
+    now = time.time()
+    mono_now = time.monotonic()
+    content_changed = False
+    
+    # Market table and latency panel only change on market updates
+    if state.dirty_markets or state.markets_refresh_until:
+        state._market_table = build_market_table(now)
+        layout["latency"].update(build_latency_panel())
+        state.dirty_markets = False
+        if now >= state.markets_refresh_until:
+            state.markets_refresh_until = 0
+        content_changed = True
+    
+    # Events table changes on event updates, plus once a second for the Age column
+    if state.dirty_events or (state.active_events and int(now) != state._events_second):
+        state._events_table = build_events_table(now)
+        state._events_second = int(now)
+        state.dirty_events = False
+        content_changed = True
+    
+    # Content - stack both tables vertically with separator
+    if content_changed:
+        layout["content"].update(Group(
+            state._market_table,
+            Rule(style="dim"),
+            state._events_table
+        ))
+    
+    # Sidebar - stats show uptime and heartbeat age, so refresh every frame
+    layout["stats"].update(build_stats_panel(mono_now))
+    
+    # Footer with key bindings
+    footer_text = "[a]dd  [r]emove  [d]emo  [c]lear  [h]elp  [q]uit"
+    status = state.get_status()
+    if status:
+        footer_text = f"{status}  |  {footer_text}"
+    layout["footer"].update(Panel(Text(footer_text, justify="center", style="dim")))
+    
+    return layout
+
+
+def build_main_layout() -> Layout:
+    """Build the static skeleton of the main layout."""
     layout = Layout()
     
     layout.split_column(
@@ -617,31 +825,141 @@ def build_layout() -> Layout:
     )
     layout["header"].update(header)
     
-    # Content - stack both tables vertically with separator
-    layout["content"].update(Group(
-        build_market_table(),
-        Rule(style="dim"),
-        build_events_table()
-    ))
-    
-    # Sidebar
-    layout["stats"].update(build_stats_panel())
-    layout["latency"].update(build_latency_panel())
-    
     # Legend footer (one-line, dim)
     legend_text = Text("Move: worst @30s/2m/5m. ▲ NO hurt, ▼ YES hurt. (Y/N)=¢ vs t0_mid", style="dim", justify="center")
     layout["legend"].update(legend_text)
     
-    # Footer with key bindings
-    footer_text = "[a]dd  [r]emove  [d]emo  [c]lear  [h]elp  [q]uit"
-    status = state.get_status()
-    if status:
-        footer_text = f"{status}  |  {footer_text}"
-    layout["footer"].update(Panel(Text(footer_text, justify="center", style="dim")))
-    
     return layout
 
 
+def _on_market_update(data: dict, payload: dict, recv_time: int):
+    # Calculate WS latency
+    msg_ts = payload.get("timestamp_ms", 0)
+    if msg_ts:
+        state.last_ws_latency = recv_time - msg_ts
+    
+    # Trust brain - just display what it sends
+    state.update_market(payload)
+
+
+def _on_would_cancel(data: dict, payload: dict, recv_time: int):
+    state.add_would_cancel(payload)
+
+
+def _on_event_update(data: dict, payload: dict, recv_time: int):
+    # Update event tracking from server
+    state.update_event(payload)
+
+
+def _on_heartbeat(data: dict, payload: dict, recv_time: int):
+    state.update_heartbeat(payload)
+
+
+def _on_ticker_added(data: dict, payload: dict, recv_time: int):
+    state.set_status(f"✅ Added: {data.get('ticker')}")
+
+
+def _on_ticker_removed(data: dict, payload: dict, recv_time: int):
+    ticker = data.get('ticker')
+    state.markets.pop(ticker, None)
+    state.mark_dirty(markets=True)
+    state.set_status(f"➖ Removed: {ticker}")
+
+
+def _on_tickers_list(data: dict, payload: dict, recv_time: int):
+    watched = data.get('watched', [])
+    state.set_status(f"📋 Watching: {', '.join(watched) if watched else 'none'}")
+
+
+def _on_available_list(data: dict, payload: dict, recv_time: int):
+    markets = data.get('markets', [])
+    # Handle both old format (list of strings) and new format (list of dicts)
+    if markets and isinstance(markets[0], dict):
+        state.available_markets = [m['ticker'] for m in markets]
+        state.available_markets_info = markets
+    else:
+        state.available_markets = markets
+        state.available_markets_info = None
+    if markets:
+        state.set_status(f"📋 Found {len(markets)} contracts - check terminal", duration=10)
+    else:
+        state.set_status("❌ No contracts found")
+
+
+def _on_error(data: dict, payload: dict, recv_time: int):
+    state.set_status(f"❌ {data.get('message', 'Unknown error')}", duration=10)
+
+
+def _render_search_menu(results: list, subtitles: list) -> Optional[Text]:
+    """Render the contract selection menu once, when the results arrive."""
+    if len(results) < 2:
+        return None
+    lines = [f"\n[bold]Event has {len(results)} contracts:[/bold]"]
+    for i, (t, subtitle) in enumerate(zip(results[:10], subtitles), 1):
+        if subtitle:
+            lines.append(f"  {i}. {t} [dim]({subtitle})[/dim]")
+        else:
+            lines.append(f"  {i}. {t}")
+    if len(results) > 10:
+        lines.append(f"  ... and {len(results) - 10} more")
+    both_all = "both" if len(results) == 2 else "all"
+    lines.append(f"  [cyan]0. All (observe {both_all})[/cyan]")
+    # Same look as printing each line (markup + number highlighting), parsed once
+    return console.highlighter(Text.from_markup("\n".join(lines)))
+
+
+def _on_search_results(data: dict, payload: dict, recv_time: int):
+    # Ignore replies nobody is waiting for (late, after the prompt timed out) or for another query
+    query = state.search_query
+    if not query or str(data.get("query", query)).upper() != query:
+        return
+    # Handle both old format (tickers list) and new format (contracts list with subtitle)
+    # Normalized once here to plain tickers; subtitles only feed the menu
+    contracts = data.get('contracts', [])
+    if contracts:
+        # List of {ticker, subtitle}
+        state.search_results = [c.get("ticker", "") if isinstance(c, dict) else c for c in contracts]
+        subtitles = [c.get("subtitle", "") if isinstance(c, dict) else "" for c in contracts]
+    else:
+        # Fallback for old format
+        state.search_results = data.get('tickers', [])
+        subtitles = [""] * len(state.search_results)
+    state.search_menu = _render_search_menu(state.search_results, subtitles)
+    if state.search_results:
+        now = time.monotonic()
+        cache = state.search_cache
+        # Drop expired entries as new ones are written, so the cache stays bounded
+        for stale in [q for q, (ts, _, _) in cache.items() if now - ts >= SEARCH_CACHE_TTL]:
+            del cache[stale]
+        cache[query] = (now, state.search_results, state.search_menu)
+    if state.search_ready is not None:
+        state.search_ready.set()
+
+
+def _on_ticker_expired(data: dict, payload: dict, recv_time: int):
+    ticker = data.get('ticker')
+    if ticker:
+        state.markets.pop(ticker, None)
+        state.mark_dirty(markets=True)
+        state.set_status(f"⏰ Expired: {ticker}", duration=5)
+
+
+# Inbound message type -> handler(data, payload, recv_time)
+MESSAGE_HANDLERS = {
+    "market_update": _on_market_update,
+    "would_cancel": _on_would_cancel,
+    "event_update": _on_event_update,
+    "heartbeat": _on_heartbeat,
+    "ticker_added": _on_ticker_added,
+    "ticker_removed": _on_ticker_removed,
+    "tickers_list": _on_tickers_list,
+    "available_list": _on_available_list,
+    "error": _on_error,
+    "search_results": _on_search_results,
+    "ticker_expired": _on_ticker_expired,
+}
+
+
 async def connect_and_listen(url: str, token: str):
     """Connect to brain server and listen for updates."""
     full_url = f"{url}?token={token}"
@@ -653,127 +971,343 @@ async def connect_and_listen(url: str, token: str):
         try:
             async with websockets.connect(full_url, ssl=SSL_CONTEXT) as ws:
                 state.connected = True
-                state.connect_time = time.time()
+                state.connect_time = time.monotonic()
                 state.ws = ws
                 console.print("✅ Connected!", style="green")
                 
                 # Clear stale market data on reconnect
                 # Don't re-subscribe - tickers may have expired/changed
                 state.markets.clear()
+                state.mark_dirty(markets=True)
+                
+                # Receive text frames as raw bytes where supported (websockets >= 13),
+                # skipping the UTF-8 decode to str - the JSON codec parses bytes directly
+                recv = ws.recv
+                if "decode" in inspect.signature(ws.recv).parameters:
+                    recv = functools.partial(ws.recv, decode=False)
+                
+                # Bind hot-loop lookups to locals once per connection
+                loads = _loads
+                now_ms = _now_ms
+                get_handler = MESSAGE_HANDLERS.get
+                
+                # Reset the backoff only once data arrives - a server that accepts and
+                # then closes straight away (auth/policy) keeps backing off
+                msg = await recv()
+                state.reconnect_delay = RECONNECT_DELAY_MIN
                 
                 while True:
-                    msg = await ws.recv()
-                    recv_time = time.time() * 1000
+                    recv_time = now_ms()
                     
-                    data = json.loads(msg)
+                    data = loads(msg)
                     msg_type = data.get("type")
                     payload = data.get("data", {})
                     
-                    if msg_type == "market_update":
-                        # Calculate WS latency
-                        msg_ts = payload.get("timestamp_ms", 0)
-                        if msg_ts:
-                            state.last_ws_latency = recv_time - msg_ts
-                        
-                        # Trust brain - just display what it sends
-                        state.update_market(payload)
-                    
-                    elif msg_type == "would_cancel":
-                        state.add_would_cancel(payload)
-                    
-                    elif msg_type == "event_update":
-                        # Update event tracking from server
-                        event_id = payload.get("event_id")
-                        ts = payload.get("t0_ts") or payload.get("timestamp_ms", 0)
-                        # Only show events after cleared timestamp
-                        if event_id and ts > state.cleared_events_ts:
-                            state.active_events[event_id] = payload
-                    
-                    elif msg_type == "heartbeat":
-                        state.update_heartbeat(payload)
-                    
-                    elif msg_type == "ticker_added":
-                        state.set_status(f"✅ Added: {data.get('ticker')}")
-                    
-                    elif msg_type == "ticker_removed":
-                        ticker = data.get('ticker')
-                        state.markets.pop(ticker, None)
-                        state.set_status(f"➖ Removed: {ticker}")
-                    
-                    elif msg_type == "tickers_list":
-                        watched = data.get('watched', [])
-                        state.set_status(f"📋 Watching: {', '.join(watched) if watched else 'none'}")
+                    handler = get_handler(msg_type)
+                    if handler:
+                        handler(data, payload, recv_time)
                     
-                    elif msg_type == "available_list":
-                        markets = data.get('markets', [])
-                        # Handle both old format (list of strings) and new format (list of dicts)
-                        if markets and isinstance(markets[0], dict):
-                            state.available_markets = [m['ticker'] for m in markets]
-                            state.available_markets_info = markets
-                        else:
-                            state.available_markets = markets
-                            state.available_markets_info = None
-                        if markets:
-                            state.set_status(f"📋 Found {len(markets)} contracts - check terminal", duration=10)
-                        else:
-                            state.set_status("❌ No contracts found")
-                    
-                    elif msg_type == "error":
-                        state.set_status(f"❌ {data.get('message', 'Unknown error')}", duration=10)
-                    
-                    elif msg_type == "search_results":
-                        # Handle both old format (tickers list) and new format (contracts list with subtitle)
-                        contracts = data.get('contracts', [])
-                        if contracts:
-                            state.search_results = contracts  # List of {ticker, subtitle}
-                        else:
-                            # Fallback for old format
-                            tickers = data.get('tickers', [])
-                            state.search_results = [{"ticker": t, "subtitle": ""} for t in tickers]
-                    
-                    elif msg_type == "ticker_expired":
-                        ticker = data.get('ticker')
-                        if ticker:
-                            state.markets.pop(ticker, None)
-                            state.set_status(f"⏰ Expired: {ticker}", duration=5)
+                    msg = await recv()
                         
         except websockets.exceptions.ConnectionClosed:
             state.connected = False
             state.ws = None
-            console.print("❌ Connection lost, reconnecting in 3s...", style="red")
-            await asyncio.sleep(3)
+            delay = state.next_reconnect_delay()
+            console.print(f"❌ Connection lost, reconnecting in {delay:.1f}s...", style="red")
+            await asyncio.sleep(delay)
             
         except Exception as e:
             state.connected = False
             state.ws = None
-            console.print(f"❌ Error: {e}, reconnecting in 5s...", style="red")
-            await asyncio.sleep(5)
+            delay = state.next_reconnect_delay()
+            console.print(f"❌ Error: {e}, reconnecting in {delay:.1f}s...", style="red")
+            await asyncio.sleep(delay)
 
 
-async def send_command(cmd_type: str, ticker: str = None):
-    """Send command to server."""
+async def send_message(msg: dict) -> bool:
+    """Send one message to server; failures are reported on the status line."""
     if not state.ws:
         state.set_status("❌ Not connected")
-        return
+        return False
     
+    try:
+        await state.ws.send(_dumps(msg))
+    except Exception as e:
+        state.set_status(f"❌ Send failed: {e}")
+        return False
+    return True
+
+
+async def send_command(cmd_type: str, ticker: str = None):
+    """Send command to server."""
     msg = {"type": cmd_type}
     if ticker:
         msg["ticker"] = ticker
     
+    await send_message(msg)
+
+
+async def send_commands(msgs: list):
+    """Send several commands to server, serialized up front and written concurrently."""
+    if not state.ws:
+        state.set_status("❌ Not connected")
+        return
+    
+    payloads = [_dumps(msg) for msg in msgs]
+    
     try:
-        await state.ws.send(json.dumps(msg))
+        await asyncio.gather(*(state.ws.send(p) for p in payloads))
     except Exception as e:
         state.set_status(f"❌ Send failed: {e}")
 
 
+async def send_ticker_commands(cmd_type: str, tickers: list):
+    """Send a per-ticker command (add_ticker/remove_ticker) for several tickers.
+    
+    The brain server only accepts the singular commands, so this sends one
+    frame per ticker; it is the single place to switch to a plural frame.
+    """
+    await send_commands([{"type": cmd_type, "ticker": t} for t in tickers if t])
+
+
 async def run_display():
-    """Run the live display."""
-    with Live(build_layout(), refresh_per_second=4, console=console) as live:
+    """Run the live display, redrawing when state changes."""
+    state.render_event = asyncio.Event()
+    with Live(build_layout(), auto_refresh=False, console=console) as live:
         state.live = live
-        while True:
-            if not state.input_mode:
-                live.update(build_layout())
-            await asyncio.sleep(0.25)
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(state.render_event.wait(), timeout=RENDER_IDLE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    pass
+                state.render_event.clear()
+                if not state.input_mode:
+                    live.update(build_layout(), refresh=True)
+                # Coalesce bursts of updates into a single frame
+                await asyncio.sleep(RENDER_MIN_INTERVAL)
+        finally:
+            state.live = None  # Nothing may restart the display once it has exited
+
+
+async def _handle_quit(old_settings):
+    """Quit the observer."""
+    console.print("\n👋 Goodbye!", style="bold")
+    sys.exit(0)
+
+
+async def _handle_help(old_settings):
+    """Toggle the help screen."""
+    # Toggle help screen
+    state.help_mode = not state.help_mode
+    state.mark_dirty()
+
+
+async def _handle_demo(old_settings):
+    """Load the BTC 15m demo markets."""
+    # Demo mode - load latest BTC 15m
+    await send_command("demo_btc15m")
+    state.set_status("🎯 Loading BTC 15m demo...")
+
+
+async def _handle_clear(old_settings):
+    """Clear risk events."""
+    # Set cleared timestamp - events before this will be hidden
+    state.cleared_events_ts = _now_ms()  # ms to match t0_ts
+    state.would_cancel_events.clear()
+    state.active_events.clear()
+    state.visible_event_order.clear()
+    state.mark_dirty(events=True)
+    state.set_status("🗑️ Events cleared")
+
+
+async def _handle_add(old_settings):
+    """Prompt for a Kalshi URL or ticker and add it."""
+    ticker = None
+    with _cooked_mode(old_settings):
+        console.print("\n[bold]Add Market[/bold]")
+        console.print("Paste Kalshi URL or enter ticker directly:")
+
+        user_input = await _ask("URL or ticker")
+
+        if user_input:
+            # Check if it's a URL
+            if "kalshi.com" in user_input.lower():
+                # Extract ticker from URL: .../kxunitedcupmatch-26jan08merkre
+                ticker_part = normalize_ticker(user_input.rstrip('/').rpartition('/')[2])
+
+                # Reuse results of an earlier search for the same event
+                cached = state.search_cache.get(ticker_part)
+                if cached and time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+                    _, state.search_results, state.search_menu = cached
+                else:
+                    # Clear previous results
+                    state.search_results = []
+                    state.search_menu = None
+                    state.search_query = ticker_part
+                    state.search_ready.clear()
+
+                    # Search for matching tickers
+                    console.print(f"[dim]Searching for: {ticker_part}...[/dim]")
+                    sent = await send_message({"type": "search_ticker", "query": ticker_part})
+
+                    # Wait up to 3 seconds for results
+                    try:
+                        if sent:
+                            await asyncio.wait_for(state.search_ready.wait(), timeout=3.0)
+                    except asyncio.TimeoutError:
+                        pass
+                    finally:
+                        state.search_query = ""  # Stop accepting replies for this search
+
+                # Snapshot - a late reply can replace state.search_results while the
+                # prompt is open, and the choice must index the menu that was printed
+                results, menu = state.search_results, state.search_menu
+                if results:
+                    if len(results) == 1:
+                        ticker = results[0]
+                        console.print(f"[green]Found: {ticker}[/green]")
+                    elif state.auto_both and len(results) == 2:
+                        # Binary event - skip the menu
+                        await send_ticker_commands("add_ticker", results)
+                        console.print(f"[green]Added both: {', '.join(results)}[/green]")
+                    else:
+                        console.print(menu)
+                        choice = await _ask("Select contract to observe (0=all)")
+                        if choice == "0":
+                            # Add all contracts
+                            await send_ticker_commands("add_ticker", results)
+                            console.print(f"[green]Added {len(results)} contracts[/green]")
+                            ticker = None  # Already added
+                        elif choice.isdigit():
+                            idx = int(choice) - 1
+                            if 0 <= idx < len(results):
+                                ticker = results[idx]
+                else:
+                    # Report on the status line rather than blocking the loop on input()
+                    state.set_status(f"❌ No contracts found matching: {ticker_part}", duration=10)
+            else:
+                ticker = normalize_ticker(user_input)
+
+    if ticker:
+        await send_command("add_ticker", ticker)
+
+
+async def _handle_remove(old_settings):
+    """Prompt for a watched ticker and remove it."""
+    if not state.markets:
+        # Nothing to choose from - report it on the status line, without leaving the display
+        state.set_status("⚠️ No tickers being watched")
+        return
+    
+    with _cooked_mode(old_settings):
+        # Show current watched tickers (a snapshot - updates keep arriving while
+        # the prompt is open, and the numbering must match what was printed)
+        watched = list(state.markets)
+        console.print("\n[bold]Currently watching:[/bold]")
+        for i, ticker in enumerate(watched, 1):
+            console.print(f"  {i}. {ticker}")
+        console.print(f"  [cyan]0. Remove all[/cyan]")
+        choice = await _ask("Select contract to remove (0=all)")
+
+        ticker = None
+        if choice == "0":
+            # Remove all
+            removed = len(watched)
+            await send_ticker_commands("remove_ticker", watched)
+            state.markets.clear()
+            state.mark_dirty(markets=True)
+            console.print(f"[green]Removed {removed} contracts[/green]")
+        elif choice.isdigit():
+            idx = int(choice) - 1
+            if 0 <= idx < len(watched):
+                ticker = watched[idx]
+        elif choice:
+            ticker = normalize_ticker(choice)
+
+    if ticker:
+        await send_command("remove_ticker", ticker)
+
+
+# Command key -> handler(old_settings)
+KEY_HANDLERS = {
+    KEY_QUIT: _handle_quit,
+    KEY_HELP: _handle_help,
+    KEY_DEMO: _handle_demo,
+    KEY_CLEAR: _handle_clear,
+    KEY_ADD: _handle_add,
+    KEY_REMOVE: _handle_remove,
+}
+
+
+async def _ask(prompt: str) -> str:
+    """Prompt.ask on a thread, so websocket traffic keeps flowing while the user types."""
+    loop = asyncio.get_running_loop()
+    answer = loop.create_future()
+    
+    def resolve(result, error):
+        if not answer.done():
+            if error is not None:
+                answer.set_exception(error)
+            else:
+                answer.set_result(result)
+    
+    def ask():
+        try:
+            result = Prompt.ask(prompt)
+        except EOFError:
+            # Ctrl-D at the prompt - treat as cancelled input, not an observer failure
+            loop.call_soon_threadsafe(resolve, "", None)
+        except Exception as e:
+            loop.call_soon_threadsafe(resolve, None, e)
+        else:
+            loop.call_soon_threadsafe(resolve, result, None)
+    
+    # A daemon thread rather than the default executor, whose shutdown would
+    # wait for the pending read if the user quits with Ctrl-C mid-prompt
+    threading.Thread(target=ask, daemon=True).start()
+    return await answer
+
+
+@contextlib.contextmanager
+def _cooked_mode(old_settings):
+    """Hand the terminal to a prompt: stop the display and keystroke reader,
+    restore the saved settings, and put everything back when the prompt is done."""
+    import termios
+    import tty
+    
+    state.input_mode = True
+    if state.live:
+        state.live.stop()  # Paints the final frame once
+    _pause_keys()
+    # TCSANOW: don't wait for the display's output to drain (slow over ssh)
+    termios.tcsetattr(sys.stdin, termios.TCSANOW, old_settings)
+    yield
+    # Only on a normal exit - if the prompt is cancelled or fails the observer is
+    # shutting down, and restarting Live would repaint over the exit (hiding the cursor)
+    tty.setcbreak(sys.stdin.fileno())
+    _resume_keys()
+    if state.live:
+        state.live.start()
+    state.input_mode = False
+    state.mark_dirty()
+
+
+def _on_stdin():
+    # Drain everything typed so far as raw bytes (no text decoding) - a
+    # buffered read(1) would leave the rest of a burst where readiness never reports it
+    for key in os.read(sys.stdin.fileno(), 1024):
+        state.keys.put_nowait(key)
+
+
+def _pause_keys():
+    """Stop delivering keystrokes (while a prompt owns the terminal)."""
+    asyncio.get_running_loop().remove_reader(sys.stdin.fileno())
+
+
+def _resume_keys():
+    """Deliver keystrokes to handle_keyboard as soon as stdin is readable."""
+    asyncio.get_running_loop().add_reader(sys.stdin.fileno(), _on_stdin)
 
 
 async def handle_keyboard():
@@ -784,172 +1318,42 @@ async def handle_keyboard():
     # Save terminal settings
     old_settings = termios.tcgetattr(sys.stdin)
     
+    state.keys = asyncio.Queue()
+    state.search_ready = asyncio.Event()
+    
     try:
         tty.setcbreak(sys.stdin.fileno())
+        _resume_keys()
         
         while True:
-            # Check if input available
-            if select.select([sys.stdin], [], [], 0.1)[0]:
-                char = sys.stdin.read(1)
-                
-                if char == 'q':
-                    console.print("\n👋 Goodbye!", style="bold")
-                    sys.exit(0)
-                
-                elif char == 'h':
-                    # Toggle help screen
-                    state.help_mode = not state.help_mode
-                
-                elif char == 'd':
-                    # Demo mode - load latest BTC 15m
-                    await send_command("demo_btc15m")
-                    state.set_status("🎯 Loading BTC 15m demo...")
-                
-                elif char == 'c':
-                    # Set cleared timestamp - events before this will be hidden
-                    state.cleared_events_ts = time.time() * 1000  # ms to match t0_ts
-                    state.would_cancel_events.clear()
-                    state.active_events.clear()
-                    state.set_status("🗑️ Events cleared")
-                
-                elif char == 'a':
-                    # Stop display and restore terminal for input
-                    state.input_mode = True
-                    if state.live:
-                        state.live.stop()
-                    termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-                    
-                    console.print("\n[bold]Add Market[/bold]")
-                    console.print("Paste Kalshi URL or enter ticker directly:")
-                    
-                    user_input = Prompt.ask("URL or ticker")
-                    
-                    ticker = None
-                    if user_input:
-                        # Check if it's a URL
-                        if "kalshi.com" in user_input.lower():
-                            # Extract ticker from URL: .../kxunitedcupmatch-26jan08merkre
-                            parts = user_input.rstrip('/').split('/')
-                            ticker_part = parts[-1].upper()
-                            
-                            # Clear previous results
-                            state.search_results = []
-                            
-                            # Search for matching tickers
-                            console.print(f"[dim]Searching for: {ticker_part}...[/dim]")
-                            if state.ws:
-                                await state.ws.send(json.dumps({"type": "search_ticker", "query": ticker_part}))
-                            
-                            # Wait up to 3 seconds for results
-                            for _ in range(6):
-                                await asyncio.sleep(0.5)
-                                if state.search_results:
-                                    break
-                            
-                            if state.search_results:
-                                if len(state.search_results) == 1:
-                                    ticker = state.search_results[0].get("ticker") if isinstance(state.search_results[0], dict) else state.search_results[0]
-                                    console.print(f"[green]Found: {ticker}[/green]")
-                                else:
-                                    console.print(f"\n[bold]Event has {len(state.search_results)} contracts:[/bold]")
-                                    for i, item in enumerate(state.search_results[:10], 1):
-                                        if isinstance(item, dict):
-                                            t = item.get("ticker", "")
-                                            subtitle = item.get("subtitle", "")
-                                            if subtitle:
-                                                console.print(f"  {i}. {t} [dim]({subtitle})[/dim]")
-                                            else:
-                                                console.print(f"  {i}. {t}")
-                                        else:
-                                            console.print(f"  {i}. {item}")
-                                    if len(state.search_results) > 10:
-                                        console.print(f"  ... and {len(state.search_results) - 10} more")
-                                    both_all = "both" if len(state.search_results) == 2 else "all"
-                                    console.print(f"  [cyan]0. All (observe {both_all})[/cyan]")
-                                    choice = Prompt.ask("Select contract to observe (0=all)")
-                                    if choice == "0":
-                                        # Add all contracts
-                                        for item in state.search_results:
-                                            t = item.get("ticker") if isinstance(item, dict) else item
-                                            await send_command("add_ticker", t)
-                                        console.print(f"[green]Added {len(state.search_results)} contracts[/green]")
-                                        ticker = None  # Already added
-                                    elif choice.isdigit():
-                                        idx = int(choice) - 1
-                                        if 0 <= idx < len(state.search_results):
-                                            item = state.search_results[idx]
-                                            ticker = item.get("ticker") if isinstance(item, dict) else item
-                            else:
-                                console.print(f"[yellow]No contracts found matching: {ticker_part}[/yellow]")
-                                console.print("[dim]Press Enter to continue...[/dim]")
-                                input()
-                        else:
-                            ticker = user_input.upper()
-                    
-                    tty.setcbreak(sys.stdin.fileno())
-                    if state.live:
-                        state.live.start()
-                    state.input_mode = False
-                    if ticker:
-                        await send_command("add_ticker", ticker)
-                
-                elif char == 'r':
-                    # Stop display and restore terminal for input
-                    state.input_mode = True
-                    if state.live:
-                        state.live.stop()
-                    termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-                    
-                    # Show current watched tickers
-                    watched = list(state.markets.keys())
-                    if watched:
-                        console.print("\n[bold]Currently watching:[/bold]")
-                        for i, ticker in enumerate(watched, 1):
-                            console.print(f"  {i}. {ticker}")
-                        console.print(f"  [cyan]0. Remove all[/cyan]")
-                        choice = Prompt.ask("Select contract to remove (0=all)")
-                        
-                        ticker = None
-                        if choice == "0":
-                            # Remove all
-                            for t in watched:
-                                await send_command("remove_ticker", t)
-                            state.markets.clear()
-                            console.print(f"[green]Removed {len(watched)} contracts[/green]")
-                        elif choice.isdigit():
-                            idx = int(choice) - 1
-                            if 0 <= idx < len(watched):
-                                ticker = watched[idx]
-                        elif choice:
-                            ticker = choice.upper()
-                    else:
-                        console.print("\n[yellow]No tickers being watched[/yellow]")
-                        await asyncio.sleep(1)
-                        ticker = None
-                    
-                    tty.setcbreak(sys.stdin.fileno())
-                    if state.live:
-                        state.live.start()
-                    state.input_mode = False
-                    if ticker:
-                        await send_command("remove_ticker", ticker)
-            
-            await asyncio.sleep(0.1)
+            key = await state.keys.get()
+            handler = KEY_HANDLERS.get(key)
+            if handler:
+                await handler(old_settings)
     
-    except Exception:
-        pass
     finally:
+        _pause_keys()
         termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
 
 
 async def run_observer(url: str, token: str):
     """Main entry point."""
-    # Run all tasks
-    await asyncio.gather(
-        connect_and_listen(url, token),
-        run_display(),
-        handle_keyboard()
-    )
+    # Run all tasks; the first one to stop (or fail) takes the others down with it
+    # (asyncio.wait rather than TaskGroup, which needs Python 3.11)
+    tasks = [
+        asyncio.ensure_future(connect_and_listen(url, token)),
+        asyncio.ensure_future(run_display()),
+        asyncio.ensure_future(handle_keyboard()),
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Let cancelled tasks unwind (restore the terminal, stop Live)
+        await asyncio.gather(*tasks, return_exceptions=True)
+    for task in done:
+        task.result()  # Re-raise the failure, if any
 
 
 def parse_args():
@@ -976,6 +1380,11 @@ def parse_args():
         default="unknown",
         help="Quote side: yes, no, both, or unknown (default: unknown)"
     )
+    parser.add_argument(
+        "--auto-both",
+        action="store_true",
+        help="Observe both contracts of a 2-contract event without asking"
+    )
     return parser.parse_args()
 
 
@@ -986,6 +1395,14 @@ def main():
     # Store config in state
     state.position_size = args.size
     state.quote_side = args.side
+    state.auto_both = args.auto_both
+    
+    # Optional faster event loop (pip install uvloop)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     
     try:
         asyncio.run(run_observer(args.url, args.token))